@@ -16,7 +16,12 @@ class DriverBehaviour(ABC):
     A behaviour determines how a driver reacts to an incoming offer.
     Subclasses must implement the decide() method, which returns
     whether the driver accepts or rejects a given offer.
+
+    Behaviours do not change after construction, so a single instance
+    can be shared by any number of drivers.
     """
+    __slots__ = ()
+
     @abstractmethod
     def decide(self, driver: 'Driver', offer: 'Offer', time: int) -> bool:
         """
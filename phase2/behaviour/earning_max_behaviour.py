@@ -12,6 +12,8 @@ class EarningMaxBehaviour(DriverBehaviour):
     """
     Decide whether the driver accepts the offer.
     """
+    __slots__ = ("_min_ratio",)
+
     def __init__(self, min_ratio):
         """
         Initialize the behaviour with a minimum ratio threshold.
@@ -24,7 +26,12 @@ class EarningMaxBehaviour(DriverBehaviour):
             >>> b.min_ratio
             2.0
         """
-        self.min_ratio = min_ratio
+        self._min_ratio = min_ratio
+
+    @property
+    def min_ratio(self) -> float:
+        """Minimum acceptable reward/time ratio (read-only)."""
+        return self._min_ratio
 
     def decide(self, driver: 'Driver', offer: 'Offer', time: int) -> bool:
         """
@@ -55,7 +62,7 @@ class EarningMaxBehaviour(DriverBehaviour):
         if offer.estimated_travel_time <= 0:
             return False
         
-        threshold = self.min_ratio
+        threshold = self._min_ratio
         
         ratio = offer.estimated_reward / offer.estimated_travel_time
         return ratio >= threshold
@@ -13,6 +13,8 @@ class GreedyDistanceBehaviour(DriverBehaviour):
     A behaviour where the driver accepts the offer if the pickup location
     is closer than a given maximum distance.
     """
+    __slots__ = ("_max_distance",)
+
     def __init__(self, max_distance: float) -> None:
         """
         Initialize the behaviour with a maximum allowed pickup distance.
@@ -28,7 +30,12 @@ class GreedyDistanceBehaviour(DriverBehaviour):
             >>> b.max_distance
             10.0
         """
-        self.max_distance = max_distance
+        self._max_distance = max_distance
+
+    @property
+    def max_distance(self) -> float:
+        """The farthest pickup distance the driver will accept (read-only)."""
+        return self._max_distance
 
     def decide(self, driver: 'Driver', offer: 'Offer', time: int) -> bool:
         """
@@ -48,4 +55,4 @@ class GreedyDistanceBehaviour(DriverBehaviour):
         """
         pickup_point = offer.request.pickup
         distance = driver.position.distance_to(pickup_point)
-        return distance < self.max_distance
+        return distance < self._max_distance
@@ -15,6 +15,8 @@ class LazyBehaviour(DriverBehaviour):
     new requests unless they have already waited for a certain amount
     of time.
     """
+    __slots__ = ("_min_wait_time",)
+
     def __init__(self, min_wait_time)-> None:
         """
         Initialize the behaviour with a required minimum wait time.
@@ -28,7 +30,12 @@ class LazyBehaviour(DriverBehaviour):
             >>> b.min_wait_time
             10
         """
-        self.min_wait_time = min_wait_time
+        self._min_wait_time = min_wait_time
+
+    @property
+    def min_wait_time(self) -> int:
+        """The minimum time a request must have waited (read-only)."""
+        return self._min_wait_time
 
     def decide(self, driver: 'Driver', offer: 'Offer', time: int) -> bool:
         """
@@ -47,4 +54,4 @@ class LazyBehaviour(DriverBehaviour):
             bool: True if driver is IDLE and request.wait_time >= min_wait_time, otherwise False.
         """
         
-        return driver.status == "IDLE" and offer.request.wait_time >= self.min_wait_time
\ No newline at end of file
+        return driver.status == "IDLE" and offer.request.wait_time >= self._min_wait_time
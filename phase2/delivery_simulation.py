@@ -14,7 +14,7 @@ from .request import Request
 from .policies.dispatch_policy import DispatchPolicy
 from .request_generator import RequestGenerator
 from .mutationrule.mutationrule import MutationRule
-from .offer import Offer
+from .offer import OfferBatch
 
 
 class DeliverySimulation:
@@ -49,6 +49,11 @@ class DeliverySimulation:
 
         self.drivers = drivers
         self.requests = requests
+        # Requests can only leave the WAITING state, so the per-tick sweep
+        # only has to revisit the ones that were still waiting last tick.
+        self._waiting_requests: List[Request] = [
+            request for request in requests if request.status == "WAITING"
+        ]
         self.dispatch_policy = dispatch_policy
         self.request_generator = request_generator
         self.mutation_rules = mutation_rules
@@ -86,16 +91,16 @@ class DeliverySimulation:
         self._move_drivers_and_handle_events()
 
         # Apply mutation rules to each driver
+        for rule in self.mutation_rules:
+            try:
+                rule.maybe_mutate_many(self.drivers, self.time)
+            except (AttributeError, TypeError, ValueError) as err:
+                print(f"Mutation error at time {self.time}: {err}")
+
         active_drivers = 0
         behaviour_counts = {}
 
         for driver in self.drivers:
-            for rule in self.mutation_rules:
-                try:
-                    rule.maybe_mutate(driver, self.time)
-                except (AttributeError, TypeError, ValueError) as err:
-                    print(f"Mutation error at time {self.time}: {err}")
-            
             # Count behaviour
             if driver.behaviour is None:
                 behaviour_name = "no_behaviour"
@@ -142,15 +147,16 @@ class DeliverySimulation:
         Return a state snapshot for the GUI.
         """
 
-        drivers_snapshot = []
-        for driver in self.drivers:
-            pos = driver.position
-            drivers_snapshot.append({
+        drivers_snapshot = [
+            {
                 "id": driver.id,
                 "x": pos.x if pos else None,
                 "y": pos.y if pos else None,
                 "status": driver.status,
-            })
+            }
+            for driver in self.drivers
+            for pos in (driver.position,)
+        ]
 
         pickups = [request.pickup for request in self.requests if request.status in ("WAITING", "ASSIGNED")]
         dropoffs = [request.dropoff for request in self.requests if request.status == "PICKED"]
@@ -182,6 +188,7 @@ class DeliverySimulation:
         if new_requests:
             try:
                 self.requests.extend(new_requests)
+                self._waiting_requests.extend(new_requests)
             except (AttributeError, TypeError, ValueError) as err:
                 print(f"Error adding new requests at time {self.time}: {err}")
 
@@ -192,52 +199,53 @@ class DeliverySimulation:
         
         This filters to only WAITING requests for assignment proposals.
         ASSIGNED/PICKED requests are handled separately by their drivers.
+        Only requests that were still waiting after the previous tick, plus
+        newly generated ones, are revisited.
         """
         waiting_requests: List[Request] = []
-        for request in self.requests:
+        now = self.time
+        timeout = self.timeout
+        for request in self._waiting_requests:
             if request.status == "WAITING":
-                request.update_wait(self.time)
-                if request.wait_time > self.timeout:
-                    request.mark_expired(self.time)
+                request.update_wait(now)
+                if request.wait_time > timeout:
+                    request.mark_expired(now)
                     self.expired_count += 1
                 else:
                     waiting_requests.append(request)
+        self._waiting_requests = waiting_requests
         return waiting_requests
 
 
-    def _propose_assignments(self, active_requests: List[Request]) -> List[Tuple[Driver, Request]]:
+    def _propose_assignments(self, active_requests: List[Request]) -> OfferBatch:
         """
         Ask the dispatch policy to propose driver–request assignments.
+
+        The policy returns its proposals as an OfferBatch with travel time
+        and reward already estimated.
         """
 
         if self.dispatch_policy is None:
-            return []
+            return OfferBatch()
         try:
-            proposals = self.dispatch_policy.assign(self.drivers, active_requests, self.time)
+            proposals = self.dispatch_policy.assign_offers(self.drivers, active_requests, self.time)
             if proposals is None:
-                proposals = []
+                proposals = OfferBatch()
         except (AttributeError, TypeError, ValueError) as err:
             print(f"Dispatch policy error at time {self.time}: {err}")
-            proposals = []
+            proposals = OfferBatch()
         return proposals
 
 
-    def _process_offers(self, proposals: List[Tuple[Driver, Request]]) -> List[Tuple[Driver, Request]]:
-        """Create offers from proposals and collect accepted ones."""
+    def _process_offers(self, batch: OfferBatch) -> List[Tuple[Driver, Request]]:
+        """Evaluate driver decisions on the proposed offers and collect accepted ones."""
         accepted = []
-        for driver, request in proposals:
+        for index in range(len(batch)):
+            driver = batch.drivers[index]
+            request = batch.requests[index]
             try:
-                distance_to_pickup = driver.position.distance_to(request.pickup)
-                estimated_travel_time = distance_to_pickup / max(driver.speed, 0.1)
-                distance_pickup_to_dropoff = request.pickup.distance_to(request.dropoff)
-                total_distance = distance_to_pickup + distance_pickup_to_dropoff
-
-                base_reward = 15.0
-                distance_bonus = 1.5 * total_distance
-                estimated_reward = base_reward + distance_bonus
-
-                offer = Offer(driver, request, estimated_travel_time, estimated_reward)
-            except (AttributeError, TypeError, ValueError, ZeroDivisionError) as err:
+                offer = batch.offer(index)
+            except (TypeError, ValueError) as err:
                 print(f"Offer creation error for driver/req at time {self.time}: {err}")
                 continue
 
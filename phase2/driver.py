@@ -16,6 +16,20 @@ class Driver:
     behaviour policy, and maintains a history of completed trips for
     statistics and analysis.
     """
+
+    __slots__ = (
+        "id",
+        "position",
+        "speed",
+        "behaviour",
+        "status",
+        "current_request",
+        "position_at_assignment",
+        "assigned_reward",
+        "assignment_time",
+        "history",
+    )
+
     def __init__(self, id: int, position: Point, speed: float, behaviour: DriverBehaviour, status: str = "IDLE", current_request: Request | None = None, history: list | None = None) -> None:
         """
         Initialize a Driver instance.
@@ -56,7 +70,7 @@ class Driver:
         as assigned.
         """
 
-        self.position_at_assignment = self.position
+        self.position_at_assignment = Point(self.position.x, self.position.y)
         self.current_request = request
         self.assigned_reward = 0.0
         self.status = "TO_PICKUP"
@@ -109,12 +123,13 @@ class Driver:
             movement = self.speed * dt
 
             if distance <= movement:
-                self.position = destination
+                # Copy so later in-place moves never modify the request's point.
+                self.position = Point(destination.x, destination.y)
             else:
                 ratio = movement / distance
-                direction = destination - self.position
-                travel = direction * ratio
-                self.position += travel
+                position = self.position
+                position.add_xy((destination.x - position.x) * ratio,
+                                (destination.y - position.y) * ratio)
         except (AttributeError, TypeError, ZeroDivisionError, ValueError) as err:
             print(f"Movement error for driver {self.id}: {err}")
             return
@@ -5,10 +5,10 @@ This rule randomly mutates a driver's behaviour with a fixed probability
 in order to encourage exploration.
 """
 import random
-from .mutationrule import MutationRule
+from math import log, log1p
+from .mutationrule import MutationRule, DEFAULT_LAZY, DEFAULT_GREEDY, DEFAULT_EARNING
 from ..behaviour.greedy_distance_behaviour import GreedyDistanceBehaviour
 from ..behaviour.lazy_behaviour import LazyBehaviour
-from ..behaviour.earning_max_behaviour import EarningMaxBehaviour
 from ..driver import Driver
 
 class ExplorationMutationRule(MutationRule):
@@ -17,12 +17,16 @@ class ExplorationMutationRule(MutationRule):
     at random to avoid static behaviour.
     """
 
-    def __init__(self, probability: float):
+    def __init__(self, probability: float, rng: random.Random | None = None):
         """
         Initialize the rule with a base mutation probability.
 
         Args:
             probability (float): Base mutation probability between 0 and 1.
+            rng (random.Random | None, optional): Random number generator used
+                for the mutation draws. Passing the same instance to several
+                rules lets a whole simulation be reproduced from one seed.
+                Defaults to the global `random` module.
 
         Example:
             >>> rule = ExplorationMutationRule(0.1)
@@ -30,6 +34,7 @@ class ExplorationMutationRule(MutationRule):
             0.1
         """
         self.probability = probability
+        self.rng = rng if rng is not None else random
 
     def maybe_mutate(self, driver: "Driver", time: int) -> None:
         """
@@ -48,14 +53,69 @@ class ExplorationMutationRule(MutationRule):
             None
         """
 
-        if random.random() >= self.probability:
+        if self.rng.random() >= self.probability:
             return
 
+        self._mutate(driver)
+
+    def maybe_mutate_many(self, drivers: list["Driver"], time: int) -> None:
+        """
+        Randomly mutate the behaviour of drivers in the fleet.
+
+        Instead of drawing one random number per driver, the gap to the
+        next mutating driver is drawn from the geometric distribution, so
+        only about `probability * len(drivers)` draws are made per tick.
+        Each driver still mutates independently with the same probability.
+
+        Args:
+            drivers (list[Driver]): The drivers that may mutate.
+            time (int): Current simulation time.
+
+        Returns:
+            None
+        """
+        probability = self.probability
+
+        if probability <= 0:
+            return
+
+        if probability >= 1:
+            for driver in drivers:
+                self._mutate_or_report(driver, time)
+            return
+
+        log_keep = log1p(-probability)
+        draw = self.rng.random
+        count = len(drivers)
+        index = -1
+
+        while True:
+            # Compare the gap before converting it, since a very small
+            # probability can make it too large (or infinite) for int().
+            gap = log(1.0 - draw()) / log_keep
+            if gap >= count:
+                return
+
+            index += 1 + int(gap)
+            if index >= count:
+                return
+
+            self._mutate_or_report(drivers[index], time)
+
+    def _mutate_or_report(self, driver: "Driver", time: int) -> None:
+        """Mutate one driver, printing any error instead of raising it."""
+        try:
+            self._mutate(driver)
+        except (AttributeError, TypeError, ValueError) as err:
+            print(f"Mutation error at time {time}: {err}")
+
+    def _mutate(self, driver: "Driver") -> None:
+        """Move the driver to the next behaviour in the cycle."""
         if isinstance(driver.behaviour, LazyBehaviour):
-            driver.behaviour = GreedyDistanceBehaviour(max_distance=10.0)
+            driver.behaviour = DEFAULT_GREEDY
 
         elif isinstance(driver.behaviour, GreedyDistanceBehaviour):
-            driver.behaviour = EarningMaxBehaviour(min_ratio=1.0)
+            driver.behaviour = DEFAULT_EARNING
 
         else:
-            driver.behaviour = LazyBehaviour(min_wait_time=5)
\ No newline at end of file
+            driver.behaviour = DEFAULT_LAZY
@@ -8,6 +8,15 @@ such as performance-based mutation or random exploration.
 
 from abc import ABC, abstractmethod
 from ..driver import Driver
+from ..behaviour.greedy_distance_behaviour import GreedyDistanceBehaviour
+from ..behaviour.lazy_behaviour import LazyBehaviour
+from ..behaviour.earning_max_behaviour import EarningMaxBehaviour
+
+# Default behaviours assigned by mutation rules. Behaviours are read-only,
+# so every mutated driver can share these instances.
+DEFAULT_LAZY = LazyBehaviour(min_wait_time=5)
+DEFAULT_GREEDY = GreedyDistanceBehaviour(max_distance=10.0)
+DEFAULT_EARNING = EarningMaxBehaviour(min_ratio=1.0)
 
 class MutationRule(ABC):
     """
@@ -28,4 +37,26 @@ class MutationRule(ABC):
 
         Returns:
             None
-        """
\ No newline at end of file
+        """
+
+    def maybe_mutate_many(self, drivers: list[Driver], time: int) -> None:
+        """
+        Apply the rule to every driver in the fleet.
+
+        The default implementation calls `maybe_mutate` for each driver.
+        An error while mutating one driver is printed and does not stop
+        the remaining drivers from being evaluated. Rules that can decide
+        for the whole fleet at once may override it.
+
+        Args:
+            drivers (list[Driver]): The drivers that may mutate.
+            time (int): Current simulation time.
+
+        Returns:
+            None
+        """
+        for driver in drivers:
+            try:
+                self.maybe_mutate(driver, time)
+            except (AttributeError, TypeError, ValueError) as err:
+                print(f"Mutation error at time {time}: {err}")
@@ -7,8 +7,7 @@ selective in order to improve future performance.
 """
 
 
-from .mutationrule import MutationRule
-from ..behaviour.greedy_distance_behaviour import GreedyDistanceBehaviour
+from .mutationrule import MutationRule, DEFAULT_GREEDY
 from ..driver import Driver
 
 class PerformanceBasedMutation(MutationRule):
@@ -42,17 +41,11 @@ class PerformanceBasedMutation(MutationRule):
         if len(driver.history) < self.N:
             return
 
-        delivered = 0
-
-        # Look at the last N trips (simple and explicit)
-        for i in range(self.N):
-            trip = driver.history[-1 - i]
-
-            if trip.get("status") == "DELIVERED":
-                delivered += 1
+        # Look at the last N trips
+        recent_trips = driver.history[-self.N:]
+        delivered = sum(1 for trip in recent_trips if trip.get("status") == "DELIVERED")
 
         success_rate = delivered / self.N
 
         if success_rate < self.threshold:
-            driver.behaviour = GreedyDistanceBehaviour(max_distance=10.0)
-
+            driver.behaviour = DEFAULT_GREEDY
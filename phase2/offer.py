@@ -3,6 +3,10 @@ This module defines the offer class which represents
 a suggested assignment between a driver and a request
 """
 
+BASE_REWARD = 15.0
+REWARD_PER_DISTANCE = 1.5
+MIN_SPEED = 0.1
+
 class Offer:
     """
     Represents an offer given to a driver to fulfill a request.
@@ -11,6 +15,7 @@ class Offer:
     travel time and an optional estimated reward for completing
     the request.
     """
+    __slots__ = ("driver", "request", "estimated_travel_time", "estimated_reward")
 
     def __init__(self,
                  driver: 'Driver',
@@ -25,15 +30,102 @@ class Offer:
             request (Request): The request the offer is for.
             estimated_travel_time (float): Estimated time it takes in simulation ticks.
             estimated_reward (float | None): Optional estimated reward for completing the request.
+
+        Raises:
+            TypeError, ValueError: If an estimate is not numeric.
+        """
+        self.driver = driver
+        self.request = request
+        self.estimated_travel_time = (estimated_travel_time
+                                      if type(estimated_travel_time) is float
+                                      else float(estimated_travel_time))
+        self.estimated_reward = (estimated_reward
+                                 if estimated_reward is None or type(estimated_reward) is float
+                                 else float(estimated_reward))
+
+class OfferBatch:
+    """
+    A batch of offers stored as parallel columns.
+
+    Instead of one Offer object per proposal, the batch keeps the drivers,
+    requests, estimated travel times and estimated rewards in separate
+    lists that share the same index. Offer objects are only created when
+    a driver behaviour needs to see them.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty OfferBatch.
+        """
+        self.drivers: list['Driver'] = []
+        self.requests: list['Request'] = []
+        self.estimated_travel_times: list[float] = []
+        self.estimated_rewards: list[float | None] = []
+
+    def __len__(self) -> int:
+        """Return the number of offers in the batch."""
+        return len(self.drivers)
+
+    def append(self,
+               driver: 'Driver',
+               request: 'Request',
+               estimated_travel_time: float,
+               estimated_reward: float | None = None) -> None:
+        """
+        Add an offer to the batch.
+
+        The values are stored as given. Estimates are converted to float,
+        and checked, when offer() builds the Offer.
+
+        Args:
+            driver (Driver): The driver receiving the offer.
+            request (Request): The request the offer is for.
+            estimated_travel_time (float): Estimated time it takes in simulation ticks.
+            estimated_reward (float | None): Optional estimated reward for completing the request.
+        """
+        self.drivers.append(driver)
+        self.requests.append(request)
+        self.estimated_travel_times.append(estimated_travel_time)
+        self.estimated_rewards.append(estimated_reward)
+
+    def add_proposal(self,
+                     driver: 'Driver',
+                     request: 'Request',
+                     distance_to_pickup: float | None = None) -> None:
+        """
+        Estimate travel time and reward for a proposed match and add it.
+
+        The travel time is the pickup distance divided by the driver's
+        speed. The reward is a base fare plus a bonus for the total
+        distance (to the pickup and on to the dropoff).
+
+        Args:
+            driver (Driver): The driver receiving the offer.
+            request (Request): The request the offer is for.
+            distance_to_pickup (float | None): Distance from the driver to the
+                pickup if the caller already knows it. Computed when None.
+        """
+        if distance_to_pickup is None:
+            distance_to_pickup = driver.position.distance_to(request.pickup)
+        estimated_travel_time = distance_to_pickup / max(driver.speed, MIN_SPEED)
+        total_distance = distance_to_pickup + request.pickup.distance_to(request.dropoff)
+        estimated_reward = BASE_REWARD + REWARD_PER_DISTANCE * total_distance
+        self.append(driver, request, estimated_travel_time, estimated_reward)
+
+    def offer(self, index: int) -> Offer:
+        """
+        Build the Offer stored at the given index.
+
+        Args:
+            index (int): Position of the offer in the batch.
+
+        Returns:
+            Offer: The offer at that position.
+
+        Raises:
+            TypeError, ValueError: If a stored estimate is not numeric.
         """
-        try:
-            self.driver = driver
-            self.request = request
-            self.estimated_travel_time = float(estimated_travel_time)
-            self.estimated_reward = estimated_reward if estimated_reward is None else float(estimated_reward)
-        except (TypeError, ValueError) as err:
-            print(f"Offer initialization error: {err}")
-            self.driver = driver
-            self.request = request
-            self.estimated_travel_time = 0.0
-            self.estimated_reward = None
\ No newline at end of file
+        return Offer(self.drivers[index],
+                     self.requests[index],
+                     self.estimated_travel_times[index],
+                     self.estimated_rewards[index])
@@ -1,11 +1,15 @@
 """
 A 2D point class with basic math operations
 
+Coordinates are validated once, when a Point is created. The arithmetic
+operators do not re-validate their operands, since they sit on the hot
+path of driver movement and dispatch.
+
 Modules:
 - Math
 
 """
-from math import sqrt
+from math import hypot
 
 
 class Point:
@@ -16,6 +20,8 @@ class Point:
     x (float): x-value
     y (float): y-value
     """
+    __slots__ = ("x", "y")
+
     def __init__(self, x:float, y:float) -> None:
         """
         Initialize a Point.
@@ -51,12 +57,7 @@ class Point:
             >>> point1.distance_to(point2)
             5.0
         """
-        try:
-            dx = self.x - other.x
-            dy = self.y - other.y
-        except (AttributeError, TypeError) as err:
-            raise TypeError("distance_to expects a Point-like object with .x and .y") from err
-        return sqrt(dx ** 2 + dy ** 2)
+        return hypot(self.x - other.x, self.y - other.y)
 
     def __add__(self, other: "Point") -> "Point":
         """Add two points and return a new Point.
@@ -66,10 +67,7 @@ class Point:
             >>> (p.x, p.y)
             (4, 6)
         """
-        try:
-            return Point(self.x + other.x, self.y + other.y)
-        except (AttributeError, TypeError) as err:
-            raise TypeError("Can only add Point-like objects with .x and .y") from err
+        return Point(self.x + other.x, self.y + other.y)
 
     def __iadd__(self, other: "Point") -> "Point":
         """In-place addition with another Point.
@@ -80,12 +78,9 @@ class Point:
             >>> (p.x, p.y)
             (3, 4)
         """
-        try:
-            self.x += other.x
-            self.y += other.y
-            return self
-        except (AttributeError, TypeError) as err:
-            raise TypeError("Can only iadd Point-like objects with .x and .y") from err
+        self.x += other.x
+        self.y += other.y
+        return self
 
     def __sub__(self, other: "Point") -> "Point":
         """Subtract another Point and return a new Point.
@@ -95,10 +90,7 @@ class Point:
             >>> (p.x, p.y)
             (3, 2)
         """
-        try:
-            return Point(self.x - other.x, self.y - other.y)
-        except (AttributeError, TypeError) as err:
-            raise TypeError("Can only subtract Point-like objects with .x and .y") from err
+        return Point(self.x - other.x, self.y - other.y)
 
     def __isub__(self, other: "Point") -> "Point":
         """In-place subtraction with another Point.
@@ -109,12 +101,23 @@ class Point:
             >>> (p.x, p.y)
             (3, 2)
         """
-        try:
-            self.x -= other.x
-            self.y -= other.y
-            return self
-        except (AttributeError, TypeError) as err:
-            raise TypeError("Can only isub Point-like objects with .x and .y") from err
+        self.x -= other.x
+        self.y -= other.y
+        return self
+
+    def add_xy(self, dx: float, dy: float) -> "Point":
+        """Move this Point in place by the given offsets.
+
+        Avoids allocating temporary Points in movement loops.
+
+        Example:
+            >>> p = Point(1, 1).add_xy(2, 3)
+            >>> (p.x, p.y)
+            (3.0, 4.0)
+        """
+        self.x += dx
+        self.y += dy
+        return self
 
     def __mul__(self, scalar: int | float) -> "Point":
         """Multiply this Point by a scalar and return a new Point.
@@ -124,11 +127,7 @@ class Point:
             >>> (p.x, p.y)
             (4, 6)
         """
-        try:
-            s = float(scalar)
-        except (TypeError, ValueError) as err:
-            raise TypeError("Can only multiply Point by numeric scalar") from err
-        return Point(self.x * s, self.y * s)
+        return Point(self.x * scalar, self.y * scalar)
 
     def __rmul__(self, scalar: int | float) -> "Point":
         """Allow scalar * Point multiplication.
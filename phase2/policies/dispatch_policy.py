@@ -8,6 +8,7 @@ selecting which driver should serve which request.
 
 from abc import ABC,abstractmethod
 from ..driver import Driver
+from ..offer import OfferBatch
 from ..request import Request
 
 
@@ -37,4 +38,29 @@ class DispatchPolicy(ABC):
 
         Returns:
             list[tuple[Driver, Request]]: Proposed driver–request assignments.
-        """
\ No newline at end of file
+        """
+
+    def assign_offers(self, drivers: list[Driver], requests: list[Request], time: int) -> OfferBatch:
+        """
+        Propose assignments and turn them into offers in one step.
+
+        The default implementation calls assign() and estimates each offer
+        from scratch. Policies that already know the pickup distance of
+        each match can override this to pass it on instead of computing
+        it again.
+
+        Args:
+            drivers (list[Driver]): Available drivers at the current tick.
+            requests (list[Request]): Pending requests waiting to be assigned.
+            time (int): Current simulation time.
+
+        Returns:
+            OfferBatch: One offer per proposed driver–request assignment.
+        """
+        batch = OfferBatch()
+        for driver, request in self.assign(drivers, requests, time) or []:
+            try:
+                batch.add_proposal(driver, request)
+            except (AttributeError, TypeError, ValueError, ZeroDivisionError) as err:
+                print(f"Offer creation error for driver/req at time {time}: {err}")
+        return batch
@@ -3,11 +3,16 @@ Global greedy dispatch policy.
 
 This module implements a global greedy matching strategy which computes all
 driver-request pairs, sorts them by driver-to-pickup distance and greedily
-assigns the nearest available request to each driver.
+assigns the nearest available request to each driver. Distances for all
+pairs are computed in one pass by `pairwise_sq_distances`.
 """
 
+from math import sqrt
+
 from .dispatch_policy import DispatchPolicy
+from .pairwise import greedy_match, nearest_sq_distances, pairwise_sq_distances
 from ..driver import Driver
+from ..offer import OfferBatch
 from ..request import Request
 
 class GlobalGreedyPolicy(DispatchPolicy):
@@ -16,7 +21,28 @@ class GlobalGreedyPolicy(DispatchPolicy):
 
     At each simulation tick, the policy matches idle drivers to active
     requests by greedily selecting the closest available pairs.
+
+    For large fleets the policy can be limited to the `candidate_limit`
+    nearest requests of each driver. This avoids ranking every pair, at
+    the cost that a driver whose candidates are all taken by closer
+    drivers stays unmatched for the tick.
     """
+    def __init__(self, candidate_limit: int | None = None) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            candidate_limit (int | None, optional): Number of nearest requests
+                considered per driver. Defaults to None, which considers
+                every driver–request pair.
+
+        Raises:
+            ValueError: If candidate_limit is less than 1.
+        """
+        if candidate_limit is not None and candidate_limit < 1:
+            raise ValueError("candidate_limit must be at least 1")
+        self.candidate_limit = candidate_limit
+
     def assign(self, drivers: list["Driver"], requests: list["Request"], time: int) -> list[tuple["Driver", "Request"]]:
         """
         Propose driver–request assignments for the current tick.
@@ -25,30 +51,61 @@ class GlobalGreedyPolicy(DispatchPolicy):
         and matches are selected greedily so that each driver and request
         is used at most once.
         """
-        combos = []
-        
-        for driver_index, driver in enumerate(drivers):
-            if driver.status != "IDLE":
-                continue
-            for request in requests:
-                try:
-                    distance = driver.position.distance_to(request.pickup)
-                except (AttributeError, TypeError, ValueError) as err:
-                    print(f"Skipping driver/request pair due to distance error: {err}")
-                    continue
-               
-                combos.append((distance, driver_index, driver, request))
-
-        combos.sort()
-
-        used_drivers = set()
-        used_requests = set()
-        matches = []
+        return [(driver, request) for driver, request, _ in self._match(drivers, requests)]
+
+    def assign_offers(self, drivers: list[Driver], requests: list[Request], time: int) -> OfferBatch:
+        """
+        Propose assignments as offers, reusing the matched pickup distances.
 
-        for distance, _, driver, request in combos:
-            if driver not in used_drivers and request not in used_requests:
-                matches.append((driver, request))
-                used_drivers.add(driver)
-                used_requests.add(request)
+        The squared distance of every match is already known from the
+        ranking, so the offer estimates only need its square root.
+        """
+        batch = OfferBatch()
+        for driver, request, sq_distance in self._match(drivers, requests):
+            try:
+                batch.add_proposal(driver, request, sqrt(sq_distance))
+            except (AttributeError, TypeError, ValueError, ZeroDivisionError) as err:
+                print(f"Offer creation error for driver/req at time {time}: {err}")
+        return batch
+
+    def _match(self, drivers: list[Driver], requests: list[Request]) -> list[tuple[Driver, Request, float]]:
+        """
+        Greedily match idle drivers to requests by pickup distance.
+
+        Returns:
+            list[tuple[Driver, Request, float]]: Matched pairs with their
+                squared pickup distance.
+        """
+        idle_drivers = [driver for driver in drivers if driver.status == "IDLE"]
+        if not idle_drivers or not requests:
+            return []
+
+        request_count = len(requests)
+
+        try:
+            coordinates = (
+                [driver.position.x for driver in idle_drivers],
+                [driver.position.y for driver in idle_drivers],
+                [request.pickup.x for request in requests],
+                [request.pickup.y for request in requests],
+            )
+        except (AttributeError, TypeError, ValueError) as err:
+            print(f"Skipping assignment due to distance error: {err}")
+            return []
+
+        # Both branches index distances by flat position i * request_count + j.
+        # The stable sorts keep equal distances in driver order, then request order.
+        if self.candidate_limit is None or self.candidate_limit >= request_count:
+            distances = pairwise_sq_distances(*coordinates)
+            order = sorted(range(len(distances)), key=distances.__getitem__)
+        else:
+            distances = nearest_sq_distances(*coordinates, k=self.candidate_limit)
+            order = sorted(distances)
+            order.sort(key=distances.__getitem__)
+
+        matches = []
+        for index in greedy_match(order, len(idle_drivers), request_count):
+            driver_index, request_index = divmod(index, request_count)
+            matches.append((idle_drivers[driver_index], requests[request_index], distances[index]))
 
-        return matches
\ No newline at end of file
+        return matches
@@ -7,6 +7,7 @@ and waiting requests until no candidates remain.
 """
 
 from .dispatch_policy import DispatchPolicy
+from .pairwise import greedy_match, pairwise_sq_distances
 from ..driver import Driver
 from ..request import Request
 
@@ -14,14 +15,17 @@ class NearestNeighborPolicy(DispatchPolicy):
     """
     Assigns drivers to requests using a nearest-neighbor greedy strategy.
 
-    This policy repeatedly selects the closest (driver, request) pair by scanning
-    all idle drivers and all waiting requests, identifying the pair with the
-    smallest distance between the driver’s current position and the request’s
-    pickup location. Once the closest pair is found, both the driver and the
-    request are removed from consideration to avoid multiple assignments.
+    This policy repeatedly selects the closest (driver, request) pair among all
+    idle drivers and all waiting requests, measured from the driver’s current
+    position to the request’s pickup location. Once the closest pair is found,
+    both the driver and the request are removed from consideration to avoid
+    multiple assignments.
 
     The process continues until either no idle drivers or no waiting requests
-    remain.
+    remain. Rather than rescanning the remaining pairs for every match, all
+    pairs are ranked once by squared distance and walked in that order; a pair
+    is taken when neither side has been matched yet. Equal distances are
+    resolved in driver order, then request order, as a rescan would.
 
     Args:
         drivers (list[Driver]): The list of available drivers at the current simulation step.
@@ -35,33 +39,26 @@ class NearestNeighborPolicy(DispatchPolicy):
     """
     def assign(self, drivers: list[Driver], requests: list[Request], time: int) -> list[tuple[Driver, Request]]:
         matches = []
-    
-        idle_drivers = [driver for driver in drivers if driver.status == "IDLE"]
-        waiting_requests = requests[:]
-
-        while idle_drivers and waiting_requests:
-            best_pair = None
-            best_distance = float('inf')
 
-            for driver in idle_drivers:
-                for request in waiting_requests:
-                    try:
-                        distance = driver.position.distance_to(request.pickup)
-                    except (AttributeError, TypeError, ValueError) as err:
-                        print(f"Skipping driver/request pair due to distance error: {err}")
-                        continue
+        idle_drivers = [driver for driver in drivers if driver.status == "IDLE"]
+        if not idle_drivers or not requests:
+            return matches
 
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_pair = (driver, request)
-            
-            if best_pair is None:
-                break
-                
-            driver, request = best_pair
-            matches.append(best_pair)
+        try:
+            distances = pairwise_sq_distances(
+                [driver.position.x for driver in idle_drivers],
+                [driver.position.y for driver in idle_drivers],
+                [request.pickup.x for request in requests],
+                [request.pickup.y for request in requests],
+            )
+        except (AttributeError, TypeError, ValueError) as err:
+            print(f"Skipping assignment due to distance error: {err}")
+            return matches
 
-            idle_drivers.remove(driver)
-            waiting_requests.remove(request)
+        request_count = len(requests)
+        order = sorted(range(len(distances)), key=distances.__getitem__)
+        for index in greedy_match(order, len(idle_drivers), request_count):
+            driver_index, request_index = divmod(index, request_count)
+            matches.append((idle_drivers[driver_index], requests[request_index]))
 
-        return matches
\ No newline at end of file
+        return matches
@@ -0,0 +1,154 @@
+"""
+Optimal assignment dispatch policy.
+
+This module implements a dispatch strategy which matches idle drivers to
+waiting requests so that the total driver-to-pickup distance is as small as
+possible. Unlike the greedy policies it does not sort all driver-request
+pairs; it solves the assignment problem directly with the Hungarian
+algorithm.
+"""
+
+from math import inf, sqrt
+
+from .dispatch_policy import DispatchPolicy
+from .pairwise import pairwise_sq_distances
+from ..driver import Driver
+from ..request import Request
+
+
+def _min_cost_assignment(costs: list[float], rows: int, cols: int) -> list[tuple[int, int]]:
+    """
+    Solve the rectangular assignment problem with the Hungarian algorithm.
+
+    Args:
+        costs (list[float]): Flat row-major cost matrix with `rows * cols` entries.
+        rows (int): Number of rows. Must not exceed `cols`.
+        cols (int): Number of columns.
+
+    Returns:
+        list[tuple[int, int]]: One (row, column) pair per row, chosen so that
+            the sum of their costs is minimal.
+    """
+    row_potential = [0.0] * (rows + 1)
+    col_potential = [0.0] * (cols + 1)
+    # owner[j] is the 1-based row matched to column j, 0 if free.
+    owner = [0] * (cols + 1)
+    previous = [0] * (cols + 1)
+
+    for row in range(1, rows + 1):
+        owner[0] = row
+        col = 0
+        min_slack = [inf] * (cols + 1)
+        visited = [False] * (cols + 1)
+
+        while True:
+            visited[col] = True
+            current_row = owner[col]
+            offset = (current_row - 1) * cols - 1
+            delta = inf
+            next_col = 0
+
+            for j in range(1, cols + 1):
+                if not visited[j]:
+                    slack = costs[offset + j] - row_potential[current_row] - col_potential[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        previous[j] = col
+                    if min_slack[j] < delta:
+                        delta = min_slack[j]
+                        next_col = j
+
+            for j in range(cols + 1):
+                if visited[j]:
+                    row_potential[owner[j]] += delta
+                    col_potential[j] -= delta
+                else:
+                    min_slack[j] -= delta
+
+            col = next_col
+            if owner[col] == 0:
+                break
+
+        while col:
+            prev_col = previous[col]
+            owner[col] = owner[prev_col]
+            col = prev_col
+
+    return [(owner[j] - 1, j - 1) for j in range(1, cols + 1) if owner[j]]
+
+
+class OptimalAssignmentPolicy(DispatchPolicy):
+    """
+    Dispatch strategy which minimises the total pickup distance.
+
+    At each simulation tick, every idle driver is considered for every
+    waiting request and the matching with the lowest total distance is
+    chosen. When there are more drivers than requests (or the other way
+    around) the surplus drivers or requests are left unmatched.
+
+    An optional `max_pickup_distance` forbids pairs whose pickup is further
+    away. Such pairs are never proposed, even if that leaves a driver idle.
+    """
+    def __init__(self, max_pickup_distance: float | None = None) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_pickup_distance (float | None, optional): Largest pickup
+                distance a proposed pair may have. Defaults to None (no limit).
+        """
+        self.max_pickup_distance = max_pickup_distance
+
+    def assign(self, drivers: list[Driver], requests: list[Request], time: int) -> list[tuple[Driver, Request]]:
+        """
+        Propose driver–request assignments for the current tick.
+
+        Args:
+            drivers (list[Driver]): All drivers; only idle ones are matched.
+            requests (list[Request]): Pending requests waiting to be assigned.
+            time (int): Current simulation time (not used here).
+
+        Returns:
+            list[tuple[Driver, Request]]: Proposed driver–request assignments.
+        """
+        idle_drivers = [driver for driver in drivers if driver.status == "IDLE"]
+        if not idle_drivers or not requests:
+            return []
+
+        try:
+            sq_distances = pairwise_sq_distances(
+                [driver.position.x for driver in idle_drivers],
+                [driver.position.y for driver in idle_drivers],
+                [request.pickup.x for request in requests],
+                [request.pickup.y for request in requests],
+            )
+        except (AttributeError, TypeError, ValueError) as err:
+            print(f"Skipping assignment due to distance error: {err}")
+            return []
+
+        driver_count = len(idle_drivers)
+        request_count = len(requests)
+        distances = [sqrt(value) for value in sq_distances]
+        costs = distances
+
+        limit = self.max_pickup_distance
+        if limit is not None:
+            # A forbidden pair costs more than any matching of allowed pairs,
+            # so the solver uses as few of them as possible; they are dropped
+            # from the result afterwards.
+            penalty = limit * min(driver_count, request_count) + 1.0
+            costs = [distance if distance <= limit else penalty for distance in distances]
+
+        if driver_count <= request_count:
+            pairs = _min_cost_assignment(costs, driver_count, request_count)
+        else:
+            # The solver needs at least as many columns as rows, so solve the
+            # transposed problem with requests as rows.
+            transposed = [costs[i * request_count + j]
+                          for j in range(request_count)
+                          for i in range(driver_count)]
+            pairs = sorted((i, j) for j, i in _min_cost_assignment(transposed, request_count, driver_count))
+
+        if limit is not None:
+            pairs = [(i, j) for i, j in pairs if distances[i * request_count + j] <= limit]
+        return [(idle_drivers[i], requests[j]) for i, j in pairs]
@@ -0,0 +1,120 @@
+"""
+Pairwise squared-distance helpers shared by the dispatch policies.
+
+Dispatch policies compare every idle driver with every waiting request.
+The helpers in this module read the coordinates of both sides once and
+compute all squared distances in a single pass, so the policies do not
+call `Point.distance_to` for every pair. Squared distances are used
+because the square root does not change the ordering of distances.
+"""
+
+from heapq import nsmallest
+
+
+def pairwise_sq_distances(driver_xs: list[float],
+                          driver_ys: list[float],
+                          request_xs: list[float],
+                          request_ys: list[float]) -> list[float]:
+    """
+    Compute the squared distance between every driver and every request.
+
+    Args:
+        driver_xs (list[float]): x-coordinates of the drivers.
+        driver_ys (list[float]): y-coordinates of the drivers.
+        request_xs (list[float]): x-coordinates of the request pickups.
+        request_ys (list[float]): y-coordinates of the request pickups.
+
+    Returns:
+        list[float]: Flat row-major matrix where the entry at
+            `i * len(request_xs) + j` is the squared distance between
+            driver `i` and request `j`.
+
+    Example:
+        >>> pairwise_sq_distances([0.0], [0.0], [3.0, 1.0], [4.0, 0.0])
+        [25.0, 1.0]
+    """
+    pickups = list(zip(request_xs, request_ys))
+    distances = []
+    extend = distances.extend
+    # One comprehension per driver row keeps the inner loop free of method
+    # calls; the walrus reuses each difference for its square.
+    for driver_x, driver_y in zip(driver_xs, driver_ys):
+        extend([(dx := driver_x - request_x) * dx + (dy := driver_y - request_y) * dy
+                for request_x, request_y in pickups])
+    return distances
+
+
+def nearest_sq_distances(driver_xs: list[float],
+                         driver_ys: list[float],
+                         request_xs: list[float],
+                         request_ys: list[float],
+                         k: int) -> dict[int, float]:
+    """
+    Compute the squared distances from each driver to its k nearest requests.
+
+    Only one row of the distance matrix is held at a time, so memory grows
+    with the number of drivers times k instead of drivers times requests.
+
+    Args:
+        driver_xs (list[float]): x-coordinates of the drivers.
+        driver_ys (list[float]): y-coordinates of the drivers.
+        request_xs (list[float]): x-coordinates of the request pickups.
+        request_ys (list[float]): y-coordinates of the request pickups.
+        k (int): Number of nearest requests kept per driver.
+
+    Returns:
+        dict[int, float]: Squared distances keyed by the same flat row-major
+            index as `pairwise_sq_distances`. Among equally distant requests
+            the ones with the lowest index are kept.
+
+    Example:
+        >>> nearest_sq_distances([0.0], [0.0], [3.0, 1.0, 2.0], [4.0, 0.0, 0.0], k=2)
+        {1: 1.0, 2: 4.0}
+    """
+    pickups = list(zip(request_xs, request_ys))
+    request_count = len(pickups)
+    columns = range(request_count)
+    candidates = {}
+    for row, (driver_x, driver_y) in enumerate(zip(driver_xs, driver_ys)):
+        distances = [(dx := driver_x - request_x) * dx + (dy := driver_y - request_y) * dy
+                     for request_x, request_y in pickups]
+        offset = row * request_count
+        for column in nsmallest(k, columns, key=distances.__getitem__):
+            candidates[offset + column] = distances[column]
+    return candidates
+
+
+def greedy_match(order: list[int], driver_count: int, request_count: int) -> list[int]:
+    """
+    Walk ranked driver–request pairs and keep each pair whose driver and
+    request are both still free.
+
+    Args:
+        order (list[int]): Flat row-major pair indices, best pair first.
+        driver_count (int): Number of drivers (rows).
+        request_count (int): Number of requests (columns).
+
+    Returns:
+        list[int]: Flat indices of the accepted pairs, in acceptance order.
+
+    Example:
+        >>> greedy_match([0, 1, 3, 2], driver_count=2, request_count=2)
+        [0, 3]
+    """
+    used_drivers = [False] * driver_count
+    used_requests = [False] * request_count
+    accepted = []
+    # Once every driver or every request is matched, the rest of the
+    # ordering can only contain rejected pairs.
+    limit = min(driver_count, request_count)
+
+    for index in order:
+        driver_index, request_index = divmod(index, request_count)
+        if not used_drivers[driver_index] and not used_requests[request_index]:
+            accepted.append(index)
+            used_drivers[driver_index] = True
+            used_requests[request_index] = True
+            if len(accepted) == limit:
+                break
+
+    return accepted
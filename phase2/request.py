@@ -5,6 +5,9 @@ a single customer order in the delivery simulation.
 
 from .point import Point
 
+# Every lifecycle state a request can legitimately be in.
+_ACTIVE_STATES = frozenset({"WAITING", "ASSIGNED", "PICKED", "DELIVERED", "EXPIRED"})
+
 
 class Request:
     """
@@ -17,6 +20,16 @@ class Request:
     has been waiting in total.
     """
 
+    __slots__ = (
+        "id",
+        "pickup",
+        "dropoff",
+        "creation_time",
+        "status",
+        "assigned_driver_id",
+        "wait_time",
+    )
+
     def __init__(
         self,
         id: int,
@@ -53,7 +66,7 @@ class Request:
         Returns:
             bool: True if the status is a known state, False otherwise.
         """
-        return self.status in ["WAITING", "ASSIGNED", "PICKED", "DELIVERED", "EXPIRED"]
+        return self.status in _ACTIVE_STATES
 
     def mark_assigned(self, driver_id: int) -> None:
         """
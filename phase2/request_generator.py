@@ -12,7 +12,7 @@ class RequestGenerator:
     whether a request is created.
     """
 
-    def __init__(self, rate: float, width: int, height: int):
+    def __init__(self, rate: float, width: int, height: int, rng: random.Random | None = None):
         """
         Initialize the request generator.
 
@@ -20,11 +20,15 @@ class RequestGenerator:
             rate (float): Probability of generating a request per tick (0–1).
             width (int): Width of the map.
             height (int): Height of the map.
+            rng (random.Random | None, optional): Random number generator used
+                for the draws, e.g. `random.Random(seed)` for a reproducible
+                request stream. Defaults to the global `random` module.
         """
         self.rate = rate
         self.width = width
         self.height = height
         self.next_id = 1
+        self.rng = rng if rng is not None else random
  
 
     def maybe_generate(self, time: int) -> list[Request]:
@@ -41,26 +45,22 @@ class RequestGenerator:
         Returns:
             list[Request]: A list containing zero or one newly generated request.
         """
-        new_requests = []
+        draw = self.rng.random
 
-        if random.random() < self.rate:
-            pickup = Point(
-                random.uniform(0, self.width),
-                random.uniform(0, self.height),
-            )
-            dropoff = Point(
-                random.uniform(0, self.width),
-                random.uniform(0, self.height),
-            )
+        if draw() >= self.rate:
+            return []
 
-            new_requests.append(
-                Request(
-                    id=self.next_id,
-                    pickup=pickup,
-                    dropoff=dropoff,
-                    creation_time=time,
-                )
-            )
-            self.next_id += 1
+        width = self.width
+        height = self.height
+        pickup = Point(draw() * width, draw() * height)
+        dropoff = Point(draw() * width, draw() * height)
 
-        return new_requests
+        request = Request(
+            id=self.next_id,
+            pickup=pickup,
+            dropoff=dropoff,
+            creation_time=time,
+        )
+        self.next_id += 1
+
+        return [request]
@@ -1,4 +1,6 @@
 class MockPoint:
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -10,6 +12,8 @@ class MockPoint:
 
 
 class MockDriver:
+    __slots__ = ("id", "position", "speed", "behaviour", "history", "status")
+
     def __init__(self, id=1, x=0, y=0, speed=1.0, behaviour= None,history= None):
         self.id = id
         self.position = MockPoint(x, y)
@@ -19,6 +23,8 @@ class MockDriver:
 
 
 class MockRequest:
+    __slots__ = ("id", "pickup", "dropoff", "wait_time")
+
     def __init__(self, id=1, pickup=None, dropoff=None, wait_time=0):
         self.id = id
         self.pickup = pickup or MockPoint(0, 0)
@@ -27,6 +33,8 @@ class MockRequest:
 
 
 class MockOffer:
+    __slots__ = ("driver", "request", "estimated_travel_time", "estimated_reward")
+
     def __init__(self, driver, request, travel_time, reward):
         self.driver = driver
         self.request = request
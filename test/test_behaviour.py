@@ -103,6 +103,20 @@ class TestBehaviours(unittest.TestCase):
             print("test_lazy_reject: FAILED")
             raise
 
+    def test_thresholds_are_read_only(self):
+        """Behaviour thresholds should be readable but not assignable."""
+        behaviours = [
+            (LazyBehaviour(min_wait_time=5), "min_wait_time", 5),
+            (GreedyDistanceBehaviour(max_distance=6), "max_distance", 6),
+            (EarningMaxBehaviour(min_ratio=2.0), "min_ratio", 2.0),
+        ]
+
+        for behaviour, name, value in behaviours:
+            with self.subTest(behaviour=type(behaviour).__name__):
+                self.assertEqual(getattr(behaviour, name), value)
+                with self.assertRaises(AttributeError):
+                    setattr(behaviour, name, 0)
+
 
 if __name__ == "__main__":
     unittest.main()
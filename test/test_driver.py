@@ -100,7 +100,7 @@ class TestDriverMovement(unittest.TestCase):
             creation_time = 0
         )
 
-        with patch.object(request, 'mark_assigned'):
+        with patch.object(Request, 'mark_assigned'):
             self.driver.assign_request(request, reward = 15.0)
         
         self.driver.step(dt = 1.0)
@@ -284,4 +284,4 @@ class TestDriverTarget(unittest.TestCase):
         self.assertEqual(result.y, 6)
         
 if __name__ == '__main__':
-    unittest.main(verbosity = 2)
+    unittest.main()
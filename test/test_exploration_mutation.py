@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import patch
 
@@ -60,5 +61,98 @@ class TestExplorationMutationRule(unittest.TestCase):
         self.assertIs(driver.behaviour, original_behaviour)
 
 
+    @patch("random.random", return_value=0.0)
+    def test_mutate_many_mutates_every_driver_on_zero_draw(self, _mock_random):
+        """
+        A draw of 0.0 gives a gap of zero drivers, so every driver in the
+        fleet should mutate.
+        """
+        drivers = [MockDriver(id=i, behaviour=LazyBehaviour(min_wait_time=5)) for i in range(4)]
+
+        rule = ExplorationMutationRule(probability=0.1)
+        rule.maybe_mutate_many(drivers, time=100)
+
+        for driver in drivers:
+            self.assertIsInstance(driver.behaviour, GreedyDistanceBehaviour)
+
+
+    def test_mutate_many_zero_probability(self):
+        """
+        With probability 0 no driver should mutate.
+        """
+        original_behaviour = LazyBehaviour(min_wait_time=5)
+        drivers = [MockDriver(id=i, behaviour=original_behaviour) for i in range(4)]
+
+        rule = ExplorationMutationRule(probability=0.0)
+        rule.maybe_mutate_many(drivers, time=100)
+
+        for driver in drivers:
+            self.assertIs(driver.behaviour, original_behaviour)
+
+
+    def test_mutate_many_tiny_probability(self):
+        """
+        A tiny probability gives a gap far beyond the fleet size (infinite
+        for 5e-324); this should not raise and no driver should mutate.
+        """
+        original_behaviour = LazyBehaviour(min_wait_time=5)
+        drivers = [MockDriver(id=i, behaviour=original_behaviour) for i in range(4)]
+
+        for probability in (1e-17, 5e-324):
+            rule = ExplorationMutationRule(probability=probability, rng=random.Random(1))
+            rule.maybe_mutate_many(drivers, time=100)
+
+        for driver in drivers:
+            self.assertIs(driver.behaviour, original_behaviour)
+
+
+    def test_mutate_many_error_in_one_driver_does_not_stop_the_fleet(self):
+        """
+        A driver that cannot be mutated should be reported and skipped,
+        while the other drivers still mutate.
+        """
+        drivers = [MockDriver(id=i, behaviour=LazyBehaviour(min_wait_time=5)) for i in range(3)]
+        drivers.insert(1, object())
+
+        rule = ExplorationMutationRule(probability=1.0)
+        with patch("builtins.print") as mock_print:
+            rule.maybe_mutate_many(drivers, time=7)
+
+        self.assertIn("Mutation error at time 7", mock_print.call_args[0][0])
+        for driver in drivers[:1] + drivers[2:]:
+            self.assertIsInstance(driver.behaviour, GreedyDistanceBehaviour)
+
+
+    @patch("random.random", return_value=0.0)
+    def test_probability_change_applies_immediately(self, _mock_random):
+        """
+        Changing the probability should take effect on the next call,
+        without waiting for the next tick.
+        """
+        original_behaviour = LazyBehaviour(min_wait_time=5)
+        driver = MockDriver(behaviour=original_behaviour)
+
+        rule = ExplorationMutationRule(probability=0.5)
+        rule.probability = 0.0
+        rule.maybe_mutate(driver, time=0)
+        rule.maybe_mutate_many([driver], time=0)
+
+        self.assertIs(driver.behaviour, original_behaviour)
+
+
+    def test_shared_rng_is_reproducible(self):
+        """
+        Two rules seeded with equal generators should make the same decisions.
+        """
+        results = []
+        for _ in range(2):
+            drivers = [MockDriver(id=i, behaviour=LazyBehaviour(min_wait_time=5)) for i in range(50)]
+            rule = ExplorationMutationRule(probability=0.3, rng=random.Random(42))
+            rule.maybe_mutate_many(drivers, time=0)
+            results.append([type(driver.behaviour) for driver in drivers])
+
+        self.assertEqual(results[0], results[1])
+
+
 if __name__ == "__main__":
     unittest.main()
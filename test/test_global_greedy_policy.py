@@ -15,7 +15,6 @@ class TestGlobalGreedyPolicy(unittest.TestCase):
         """
         Tests that a single driver is matched with the closest request.
         """
-        print("\nRunning test_single_match...")
         drivers = [
             MockDriver(id=1, x=0, y=0),
         ]
@@ -27,15 +26,10 @@ class TestGlobalGreedyPolicy(unittest.TestCase):
         policy = GlobalGreedyPolicy()
         matches = policy.assign(drivers, requests, time=0)
 
-        try:
-            self.assertEqual(len(matches), 1)
-            driver, request = matches[0]
-            self.assertEqual(driver.id, 1)
-            self.assertEqual(request.id, 2)
-            print("test_single_match: SUCCESSFUL")
-        except AssertionError:
-            print("test_single_match: FAILED")
-            raise
+        self.assertEqual(len(matches), 1)
+        driver, request = matches[0]
+        self.assertEqual(driver.id, 1)
+        self.assertEqual(request.id, 2)
 
 
     def test_multiple_matches(self):
@@ -43,7 +37,6 @@ class TestGlobalGreedyPolicy(unittest.TestCase):
         Tests that multiple drivers are matched with their nearest requests
         according to the global greedy ordering.
         """
-        print("\nRunning test_multiple_matches...")
         drivers = [
             MockDriver(id=1, x=0, y=0),
             MockDriver(id=2, x=100, y=100),
@@ -59,14 +52,9 @@ class TestGlobalGreedyPolicy(unittest.TestCase):
 
         matched = {(driver.id, request.id) for driver, request in matches}
 
-        try:
-            self.assertIn((1, 1), matched)
-            self.assertIn((2, 2), matched)
-            self.assertEqual(len(matches), 2)
-            print("test_multiple_matches: SUCCESSFUL")
-        except AssertionError:
-            print("test_multiple_matches: FAILED")
-            raise
+        self.assertIn((1, 1), matched)
+        self.assertIn((2, 2), matched)
+        self.assertEqual(len(matches), 2)
 
         
     def test_equal_distance_tie_breaking(self):
@@ -91,3 +79,103 @@ class TestGlobalGreedyPolicy(unittest.TestCase):
 
         self.assertEqual(driver.id, 1)
         self.assertEqual(request.id, 1)
+
+    def test_assign_offers_reuses_pickup_distance(self):
+        """
+        assign_offers should return the same matches as assign, with the
+        travel time estimated from the matched pickup distance.
+        """
+        drivers = [
+            MockDriver(id=1, x=0, y=0, speed=2.0),
+        ]
+        drivers[0].status = "IDLE"
+        requests = [
+            MockRequest(id=1, pickup=MockPoint(3, 4), dropoff=MockPoint(3, 4)),
+        ]
+
+        batch = GlobalGreedyPolicy().assign_offers(drivers, requests, time=0)
+
+        self.assertEqual(len(batch), 1)
+        offer = batch.offer(0)
+        self.assertIs(offer.driver, drivers[0])
+        self.assertIs(offer.request, requests[0])
+        self.assertEqual(offer.estimated_travel_time, 2.5)
+        self.assertEqual(offer.estimated_reward, 15.0 + 1.5 * 5.0)
+
+    def test_candidate_limit_matches_full_search(self):
+        """
+        With one well-separated request per driver, limiting the candidates
+        should not change the matches.
+        """
+        drivers = [
+            MockDriver(id=1, x=0, y=0),
+            MockDriver(id=2, x=10, y=0),
+        ]
+        for driver in drivers:
+            driver.status = "IDLE"
+        requests = [
+            MockRequest(id=1, pickup=MockPoint(9, 0), dropoff=MockPoint(0, 0)),
+            MockRequest(id=2, pickup=MockPoint(1, 0), dropoff=MockPoint(0, 0)),
+            MockRequest(id=3, pickup=MockPoint(50, 50), dropoff=MockPoint(0, 0)),
+        ]
+
+        full = GlobalGreedyPolicy().assign(drivers, requests, time=0)
+        limited = GlobalGreedyPolicy(candidate_limit=1).assign(drivers, requests, time=0)
+
+        self.assertEqual(
+            [(d.id, r.id) for d, r in limited],
+            [(d.id, r.id) for d, r in full],
+        )
+
+    def test_candidate_limit_driver_left_unmatched(self):
+        """
+        A driver whose only candidate is taken by a closer driver should
+        stay unmatched, even though another request is still open.
+        """
+        drivers = [
+            MockDriver(id=1, x=0, y=0),
+            MockDriver(id=2, x=3, y=0),
+        ]
+        for driver in drivers:
+            driver.status = "IDLE"
+        requests = [
+            MockRequest(id=1, pickup=MockPoint(1, 0), dropoff=MockPoint(0, 0)),
+            MockRequest(id=2, pickup=MockPoint(20, 0), dropoff=MockPoint(0, 0)),
+        ]
+
+        matches = GlobalGreedyPolicy(candidate_limit=1).assign(drivers, requests, time=0)
+
+        self.assertEqual([(d.id, r.id) for d, r in matches], [(1, 1)])
+
+    def test_candidate_limit_must_be_positive(self):
+        """
+        A candidate limit below 1 should be rejected.
+        """
+        for limit in (0, -1):
+            with self.subTest(limit=limit):
+                with self.assertRaises(ValueError):
+                    GlobalGreedyPolicy(candidate_limit=limit)
+
+
+    def test_each_driver_and_request_matched_once(self):
+        """
+        No driver or request may appear in more than one match, so there
+        are never more matches than min(drivers, requests).
+        """
+        drivers = [
+            MockDriver(id=1, x=0, y=0),
+            MockDriver(id=2, x=1, y=0),
+        ]
+        for driver in drivers:
+            driver.status = "IDLE"
+        requests = [
+            MockRequest(id=1, pickup=MockPoint(0, 0), dropoff=MockPoint(0, 0)),
+            MockRequest(id=2, pickup=MockPoint(0, 1), dropoff=MockPoint(0, 0)),
+            MockRequest(id=3, pickup=MockPoint(1, 1), dropoff=MockPoint(0, 0)),
+        ]
+
+        matches = GlobalGreedyPolicy().assign(drivers, requests, time=0)
+
+        self.assertLessEqual(len(matches), min(len(drivers), len(requests)))
+        self.assertEqual(len({driver.id for driver, _ in matches}), len(matches))
+        self.assertEqual(len({request.id for _, request in matches}), len(matches))
@@ -20,7 +20,6 @@ class TestNearestNeighborPolicy(unittest.TestCase):
         one match, pairing the driver with the request. This verifies the correct
         handling of minimal input and proper output structure.
         """
-        print("\nRunning test_single_match...")
         drivers = [
             MockDriver(id=1, x=0, y=0),
         ]
@@ -31,15 +30,10 @@ class TestNearestNeighborPolicy(unittest.TestCase):
         policy = NearestNeighborPolicy()
         matches = policy.assign(drivers, requests, time=0)
 
-        try:
-            self.assertEqual(len(matches), 1)
-            d, r = matches[0]
-            self.assertEqual(d.id, 1)
-            self.assertEqual(r.id, 1)
-            print("test_single_match: SUCCESSFUL")
-        except AssertionError:
-            print("test_single_match: FAILED")
-            raise
+        self.assertEqual(len(matches), 1)
+        d, r = matches[0]
+        self.assertEqual(d.id, 1)
+        self.assertEqual(r.id, 1)
 
 
     def test_greedy_stepwise_selection(self):
@@ -53,7 +47,6 @@ class TestNearestNeighborPolicy(unittest.TestCase):
         3. Match Driver 2 to Request 2 in the next iteration.
 
         """
-        print("\nRunning test_greedy_stepwise_selection...")
         drivers = [
             MockDriver(id=1, x=0, y=0),
             MockDriver(id=2, x=100, y=100),
@@ -68,14 +61,9 @@ class TestNearestNeighborPolicy(unittest.TestCase):
 
         matched = {(d.id, r.id) for d, r in matches}
 
-        try:
-            self.assertIn((1, 1), matched)
-            self.assertIn((2, 2), matched)
-            self.assertEqual(len(matches), 2)
-            print("test_greedy_stepwise_selection: SUCCESSFUL")
-        except AssertionError:
-            print("test_greedy_stepwise_selection: FAILED")
-            raise
+        self.assertIn((1, 1), matched)
+        self.assertIn((2, 2), matched)
+        self.assertEqual(len(matches), 2)
 
 
     def test_conflicting_choices(self):
@@ -93,7 +81,6 @@ class TestNearestNeighborPolicy(unittest.TestCase):
         This test ensures that the algorithm resolves conflicts correctly
         by always prioritizing the smallest distance in each iteration.
         """
-        print("\nRunning test_conflicting_choices...")
         drivers = [
             MockDriver(id=1, x=0, y=0),
             MockDriver(id=2, x=2, y=0),
@@ -106,11 +93,6 @@ class TestNearestNeighborPolicy(unittest.TestCase):
         policy = NearestNeighborPolicy()
         matches = policy.assign(drivers, requests, time=0)
 
-        try:
-            d1, r1 = matches[0]
-            self.assertEqual(d1.id, 1)
-            self.assertEqual(r1.id, 1)
-            print("test_conflicting_choices: SUCCESSFUL")
-        except AssertionError:
-            print("test_conflicting_choices: FAILED")
-            raise
+        d1, r1 = matches[0]
+        self.assertEqual(d1.id, 1)
+        self.assertEqual(r1.id, 1)
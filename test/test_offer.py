@@ -0,0 +1,80 @@
+import unittest
+from phase2.offer import Offer, OfferBatch, BASE_REWARD, REWARD_PER_DISTANCE, MIN_SPEED
+from .mock.mock_objects import MockDriver, MockRequest, MockPoint
+
+
+class TestOfferBatch(unittest.TestCase):
+    """Test suite for the OfferBatch class."""
+
+    def setUp(self):
+        """Set up a driver and a request 5 units from its pickup."""
+        self.driver = MockDriver(id=1, x=0, y=0, speed=2.0)
+        self.request = MockRequest(id=1, pickup=MockPoint(3, 4), dropoff=MockPoint(3, 10))
+
+    def test_append_keeps_columns_aligned(self):
+        """Appended offers should share one index across all columns."""
+        batch = OfferBatch()
+        other = MockRequest(id=2)
+
+        batch.append(self.driver, self.request, 1.0, 20.0)
+        batch.append(self.driver, other, 2.0)
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.requests, [self.request, other])
+        self.assertEqual(batch.estimated_travel_times, [1.0, 2.0])
+        self.assertEqual(batch.estimated_rewards, [20.0, None])
+
+    def test_add_proposal_estimates_time_and_reward(self):
+        """Travel time uses the pickup distance, reward the whole trip."""
+        batch = OfferBatch()
+        batch.add_proposal(self.driver, self.request)
+
+        self.assertAlmostEqual(batch.estimated_travel_times[0], 2.5)
+        self.assertAlmostEqual(batch.estimated_rewards[0], BASE_REWARD + REWARD_PER_DISTANCE * 11)
+
+    def test_add_proposal_uses_known_distance(self):
+        """A distance passed by the caller should be used instead of recomputing it."""
+        batch = OfferBatch()
+        batch.add_proposal(self.driver, self.request, distance_to_pickup=8.0)
+
+        self.assertAlmostEqual(batch.estimated_travel_times[0], 4.0)
+        self.assertAlmostEqual(batch.estimated_rewards[0], BASE_REWARD + REWARD_PER_DISTANCE * 14)
+
+    def test_add_proposal_stationary_driver(self):
+        """A driver with zero speed should fall back to the minimum speed."""
+        batch = OfferBatch()
+        driver = MockDriver(id=2, speed=0.0)
+        batch.add_proposal(driver, self.request)
+
+        self.assertAlmostEqual(batch.estimated_travel_times[0], 5.0 / MIN_SPEED)
+
+    def test_offer_builds_offer_at_index(self):
+        """offer() should return an Offer holding the values at that index."""
+        batch = OfferBatch()
+        batch.append(self.driver, MockRequest(id=2), 1, 2)
+        batch.append(self.driver, self.request, 3.0, None)
+
+        offer = batch.offer(1)
+
+        self.assertIsInstance(offer, Offer)
+        self.assertIs(offer.driver, self.driver)
+        self.assertIs(offer.request, self.request)
+        self.assertEqual(offer.estimated_travel_time, 3.0)
+        self.assertIsNone(offer.estimated_reward)
+
+    def test_offer_rejects_non_numeric_estimate(self):
+        """A bad estimate is stored by append() and rejected by offer()."""
+        batch = OfferBatch()
+        batch.append(self.driver, self.request, "abc", "x")
+
+        self.assertEqual(len(batch), 1)
+        with self.assertRaises(ValueError):
+            batch.offer(0)
+
+    def test_empty_batch(self):
+        """A new batch should be empty."""
+        self.assertEqual(len(OfferBatch()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
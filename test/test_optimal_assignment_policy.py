@@ -0,0 +1,93 @@
+import unittest
+
+from phase2.policies.optimal_assignment_policy import OptimalAssignmentPolicy
+from .mock.mock_objects import MockDriver, MockRequest, MockPoint
+
+
+def _idle_driver(id, x, y):
+    driver = MockDriver(id=id, x=x, y=y)
+    driver.status = "IDLE"
+    return driver
+
+
+class TestOptimalAssignmentPolicy(unittest.TestCase):
+    """
+    Tests the OptimalAssignmentPolicy by verifying that the chosen matching
+    minimises the total pickup distance, even where a greedy choice would not.
+    """
+    def test_beats_greedy_choice(self):
+        """
+        Greedy would pair driver 1 with request 1 (distance 1) and leave
+        driver 2 with request 2 (distance 10). The optimal matching swaps
+        them for a total distance of 2.
+        """
+        drivers = [
+            _idle_driver(1, 1, 0),
+            _idle_driver(2, -1, 0),
+        ]
+        requests = [
+            MockRequest(id=1, pickup=MockPoint(0, 0)),
+            MockRequest(id=2, pickup=MockPoint(2, 0)),
+        ]
+
+        matches = OptimalAssignmentPolicy().assign(drivers, requests, time=0)
+        matched = {(driver.id, request.id) for driver, request in matches}
+
+        self.assertEqual(matched, {(1, 2), (2, 1)})
+
+    def test_more_drivers_than_requests(self):
+        """
+        Surplus drivers stay unmatched and the closest driver is used.
+        """
+        drivers = [
+            _idle_driver(1, 50, 50),
+            _idle_driver(2, 0, 1),
+            _idle_driver(3, 90, 0),
+        ]
+        requests = [
+            MockRequest(id=1, pickup=MockPoint(0, 0)),
+        ]
+
+        matches = OptimalAssignmentPolicy().assign(drivers, requests, time=0)
+
+        self.assertEqual(len(matches), 1)
+        driver, request = matches[0]
+        self.assertEqual((driver.id, request.id), (2, 1))
+
+    def test_busy_drivers_are_skipped(self):
+        """
+        Drivers that are not IDLE must not be matched.
+        """
+        busy = _idle_driver(1, 0, 0)
+        busy.status = "TO_PICKUP"
+        drivers = [busy, _idle_driver(2, 10, 0)]
+        requests = [MockRequest(id=1, pickup=MockPoint(0, 0))]
+
+        matches = OptimalAssignmentPolicy().assign(drivers, requests, time=0)
+
+        self.assertEqual([(d.id, r.id) for d, r in matches], [(2, 1)])
+
+    def test_max_pickup_distance_drops_far_pairs(self):
+        """
+        A driver whose only option is beyond the limit stays unmatched,
+        while the other driver keeps its nearby request.
+        """
+        drivers = [
+            _idle_driver(1, 0, 0),
+            _idle_driver(2, 100, 0),
+        ]
+        requests = [
+            MockRequest(id=1, pickup=MockPoint(1, 0)),
+            MockRequest(id=2, pickup=MockPoint(2, 0)),
+        ]
+
+        policy = OptimalAssignmentPolicy(max_pickup_distance=10.0)
+        matches = policy.assign(drivers, requests, time=0)
+
+        self.assertEqual(len(matches), 1)
+        driver, _ = matches[0]
+        self.assertEqual(driver.id, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
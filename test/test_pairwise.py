@@ -0,0 +1,46 @@
+import unittest
+
+from phase2.policies.pairwise import greedy_match, nearest_sq_distances, pairwise_sq_distances
+
+
+class TestPairwiseSqDistances(unittest.TestCase):
+    """Unit tests for the pairwise squared-distance helper."""
+
+    def test_row_major_layout(self):
+        """Entries should be laid out driver by driver, request by request."""
+        distances = pairwise_sq_distances(
+            [0.0, 10.0], [0.0, 0.0],
+            [3.0, 10.0, 0.0], [4.0, 0.0, 1.0],
+        )
+
+        self.assertEqual(distances, [25.0, 100.0, 1.0, 65.0, 0.0, 101.0])
+
+    def test_empty_inputs(self):
+        """No drivers or no requests should give an empty matrix."""
+        self.assertEqual(pairwise_sq_distances([], [], [1.0], [1.0]), [])
+        self.assertEqual(pairwise_sq_distances([1.0], [1.0], [], []), [])
+
+    def test_nearest_keeps_k_per_driver(self):
+        """Only the k closest requests of each driver should be kept."""
+        distances = nearest_sq_distances(
+            [0.0, 10.0], [0.0, 0.0],
+            [3.0, 10.0, 0.0], [4.0, 0.0, 1.0],
+            k=1,
+        )
+
+        self.assertEqual(distances, {2: 1.0, 4: 0.0})
+
+    def test_greedy_match_skips_used_rows_and_columns(self):
+        """A pair is rejected once its driver or its request is taken."""
+        # 2 drivers x 3 requests, ranked: (0,1), (1,1), (0,0), (1,2), ...
+        order = [1, 4, 0, 5, 2, 3]
+
+        self.assertEqual(greedy_match(order, driver_count=2, request_count=3), [1, 5])
+
+    def test_greedy_match_stops_at_min_side(self):
+        """The walk ends once every driver or every request is matched."""
+        self.assertEqual(greedy_match(iter([0, 1, 2]), driver_count=1, request_count=3), [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from phase2.mutationrule.performance import PerformanceBasedMutation
 from phase2.behaviour.greedy_distance_behaviour import GreedyDistanceBehaviour
 from phase2.behaviour.lazy_behaviour import LazyBehaviour
@@ -80,3 +81,71 @@ class TestPerformanceBasedMutation(unittest.TestCase):
             driver.behaviour,
             original_behaviour
         )
+
+    def test_new_trips_are_re_evaluated(self):
+        """
+        The outcome must be recomputed once new trips are appended,
+        and re-applied while the history is unchanged.
+        """
+        original_behaviour = LazyBehaviour(None)
+
+        driver = MockDriver(
+            behaviour=original_behaviour,
+            history=[
+                {"status": "DELIVERED"},
+                {"status": "DELIVERED"},
+            ]
+        )
+
+        rule = PerformanceBasedMutation(threshold=0.5, N=2)
+        rule.maybe_mutate(driver, time=0)
+        self.assertIs(driver.behaviour, original_behaviour)
+
+        driver.history.extend([{"status": "EXPIRED"}, {"status": "EXPIRED"}])
+        rule.maybe_mutate(driver, time=1)
+        self.assertIsInstance(driver.behaviour, GreedyDistanceBehaviour)
+
+        driver.behaviour = original_behaviour
+        rule.maybe_mutate(driver, time=2)
+        self.assertIsInstance(driver.behaviour, GreedyDistanceBehaviour)
+
+    def test_threshold_change_applies_immediately(self):
+        """
+        Changing the threshold should affect the next evaluation, even if
+        the driver's history has not changed.
+        """
+        original_behaviour = LazyBehaviour(None)
+
+        driver = MockDriver(
+            behaviour=original_behaviour,
+            history=[
+                {"status": "DELIVERED"},
+                {"status": "EXPIRED"},
+            ]
+        )
+
+        rule = PerformanceBasedMutation(threshold=0.5, N=2)
+        rule.maybe_mutate(driver, time=0)
+        self.assertIs(driver.behaviour, original_behaviour)
+
+        rule.threshold = 0.9
+        rule.maybe_mutate(driver, time=1)
+        self.assertIsInstance(driver.behaviour, GreedyDistanceBehaviour)
+
+    def test_error_in_one_driver_does_not_stop_the_fleet(self):
+        """
+        A driver that raises during mutation should be reported and
+        skipped, while the other drivers are still evaluated.
+        """
+        poor_history = [{"status": "EXPIRED"}, {"status": "EXPIRED"}]
+        first = MockDriver(id=1, behaviour=LazyBehaviour(None), history=list(poor_history))
+        broken = MockDriver(id=2, behaviour=LazyBehaviour(None), history=None)
+        last = MockDriver(id=3, behaviour=LazyBehaviour(None), history=list(poor_history))
+
+        rule = PerformanceBasedMutation(threshold=0.5, N=2)
+        with patch("builtins.print") as mock_print:
+            rule.maybe_mutate_many([first, broken, last], time=4)
+
+        self.assertIn("Mutation error at time 4", mock_print.call_args[0][0])
+        self.assertIsInstance(first.behaviour, GreedyDistanceBehaviour)
+        self.assertIsInstance(last.behaviour, GreedyDistanceBehaviour)
@@ -12,20 +12,6 @@ class testPoint(unittest.TestCase):
         - that multiplication does not modify the original point
     """
 
-    def print_status(self, name, success):
-        """
-        Print SUCCESSFUL or FAILED after each test.
-
-        Arguments:
-            name (str): Name of the test.
-            success (bool): Whether the test passed.
-        """
-
-        if success:
-            print(f"{name}: SUCCESSFUL")
-        else:
-            print(f"{name}: FAILED")
-
     def test_add(self):
         """
         Test that Point.__add__ returns a new point with correct coordinates.
@@ -33,16 +19,10 @@ class testPoint(unittest.TestCase):
         Example:
             (1, 2) + (3, 4) = (4, 6)
         """
-        name = "test_add"
-        try:
-            p1 = Point(1,2)
-            p2 = Point(3,4)
-            result = p1 + p2
-            self.assertEqual((result.x, result.y), (4, 6))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p1 = Point(1,2)
+        p2 = Point(3,4)
+        result = p1 + p2
+        self.assertEqual((result.x, result.y), (4, 6))
 
     def test_sub(self):
         """
@@ -51,16 +31,10 @@ class testPoint(unittest.TestCase):
         Example:
             (5, 5) - (2, 3) = (3, 2)
         """
-        name = "test_sub"
-        try:
-            p1 = Point(5,5)
-            p2 = Point(2,3)
-            result = p1 - p2
-            self.assertEqual((result.x, result.y), (3,2))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p1 = Point(5,5)
+        p2 = Point(2,3)
+        result = p1 - p2
+        self.assertEqual((result.x, result.y), (3,2))
 
     def test_iadd(self):
         """
@@ -70,16 +44,10 @@ class testPoint(unittest.TestCase):
             p = (1, 1)
             p += (2, 1) → p becomes (3, 2)
         """
-        name = "test_iadd"
-        try:
-            p1 = Point(1,1)
-            p2 = Point(2,1)
-            p1 += p2
-            self.assertEqual((p1.x, p1.y), (3,2))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p1 = Point(1,1)
+        p2 = Point(2,1)
+        p1 += p2
+        self.assertEqual((p1.x, p1.y), (3,2))
 
     def test_isub(self):
         """
@@ -89,16 +57,10 @@ class testPoint(unittest.TestCase):
             p = (4, 1)
             p -= (2, 1) → p becomes (2, 0)
         """
-        name = "test_isub"
-        try:
-            p1 = Point(4,1)
-            p2 = Point(2,1)
-            p1 -= p2
-            self.assertEqual((p1.x, p1.y), (2,0))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p1 = Point(4,1)
+        p2 = Point(2,1)
+        p1 -= p2
+        self.assertEqual((p1.x, p1.y), (2,0))
 
     def test_mul_int(self):
         """
@@ -107,15 +69,9 @@ class testPoint(unittest.TestCase):
         Example:
             (2, 3) * 2 = (4, 6)
         """
-        name = "test_mul_int"
-        try:
-            p = Point(2, 3)
-            result = p * 2
-            self.assertEqual((result.x, result.y), (4, 6))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p = Point(2, 3)
+        result = p * 2
+        self.assertEqual((result.x, result.y), (4, 6))
 
     def test_mul_float(self):
         """
@@ -124,15 +80,9 @@ class testPoint(unittest.TestCase):
         Example:
             (1.5, -2.0) * 2.0 = (3.0, -4.0)
         """
-        name = "test_mul_float"
-        try:
-            p = Point(1.5, -2.0)
-            result = p * 2.0
-            self.assertEqual((result.x, result.y), (3.0, -4.0))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p = Point(1.5, -2.0)
+        result = p * 2.0
+        self.assertEqual((result.x, result.y), (3.0, -4.0))
 
     def test_rmul_int(self):
         """
@@ -141,15 +91,9 @@ class testPoint(unittest.TestCase):
         Example:
             3 * (4, -1) = (12, -3)
         """
-        name = "test_rmul_int"
-        try:
-            p = Point(4, -1)
-            result = 3 * p
-            self.assertEqual((result.x, result.y), (12, -3))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p = Point(4, -1)
+        result = 3 * p
+        self.assertEqual((result.x, result.y), (12, -3))
 
     def test_rmul_float(self):
         """
@@ -158,15 +102,21 @@ class testPoint(unittest.TestCase):
         Example:
             0.5 * (0.5, 2.0) = (0.25, 1.0)
         """
-        name = "test_rmul_float"
-        try:
-            p = Point(0.5, 2.0)
-            result = 0.5 * p
-            self.assertEqual((result.x, result.y), (0.25, 1.0))
-            self.print_status(name, True)
-        except Exception:
-            self.print_status(name, False)
-            raise
+        p = Point(0.5, 2.0)
+        result = 0.5 * p
+        self.assertEqual((result.x, result.y), (0.25, 1.0))
+
+    def test_add_xy_in_place(self):
+        """
+        Test that Point.add_xy moves the same point object.
+
+        Example:
+            (1, 1).add_xy(2, 3) = (3, 4)
+        """
+        p = Point(1, 1)
+        result = p.add_xy(2, 3)
+        self.assertIs(result, p)
+        self.assertEqual((p.x, p.y), (3, 4))
 
 if __name__ == "__main__":
     unittest.main()
@@ -27,35 +27,20 @@ class TestRequest(unittest.TestCase):
         self.assertIsNone(self.request.assigned_driver_id)
         self.assertEqual(self.request.wait_time, 0)
 
-    def test_is_active_waiting(self):
-        """Test is_active returns True for WAITING status."""
-        self.request.status = "WAITING"
-        self.assertTrue(self.request.is_active())
-
-    def test_is_active_assigned(self):
-        """Test is_active returns True for ASSIGNED status."""
-        self.request.status = "ASSIGNED"
-        self.assertTrue(self.request.is_active())
-
-    def test_is_active_picked(self):
-        """Test is_active returns True for PICKED status."""
-        self.request.status = "PICKED"
-        self.assertTrue(self.request.is_active())
-
-    def test_is_active_delivered(self):
-        """Test is_active returns True for DELIVERED status."""
-        self.request.status = "DELIVERED"
-        self.assertTrue(self.request.is_active())
-
-    def test_is_active_expired(self):
-        """Test is_active returns True for EXPIRED status."""
-        self.request.status = "EXPIRED"
-        self.assertTrue(self.request.is_active())
-
-    def test_is_active_unknown_status(self):
-        """Test is_active returns False for unknown status."""
-        self.request.status = "UNKNOWN"
-        self.assertFalse(self.request.is_active())
+    def test_is_active(self):
+        """Test is_active returns True only for known lifecycle statuses."""
+        cases = [
+            ("WAITING", True),
+            ("ASSIGNED", True),
+            ("PICKED", True),
+            ("DELIVERED", True),
+            ("EXPIRED", True),
+            ("UNKNOWN", False),
+        ]
+        for status, expected in cases:
+            with self.subTest(status=status):
+                self.request.status = status
+                self.assertIs(self.request.is_active(), expected)
 
     def test_mark_assigned(self):
         """Test that mark_assigned updates status and driver_id."""
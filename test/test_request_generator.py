@@ -1,3 +1,4 @@
+import random
 import unittest
 from phase2.request_generator import RequestGenerator
 from phase2.request import Request
@@ -43,6 +44,19 @@ class TestRequestGenerator(unittest.TestCase):
         self.generator.maybe_generate(time=1)
         self.assertEqual(self.generator.next_id, 3)
 
+    def test_seeded_rng_is_reproducible(self):
+        """Generators sharing a seed should produce identical requests."""
+        first = RequestGenerator(rate=0.5, width=100, height=100, rng=random.Random(7))
+        second = RequestGenerator(rate=0.5, width=100, height=100, rng=random.Random(7))
+
+        for time in range(20):
+            a = first.maybe_generate(time)
+            b = second.maybe_generate(time)
+            self.assertEqual(
+                [(r.id, r.pickup.x, r.pickup.y, r.dropoff.x, r.dropoff.y) for r in a],
+                [(r.id, r.pickup.x, r.pickup.y, r.dropoff.x, r.dropoff.y) for r in b],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()